@@ -15,6 +15,7 @@ Calistirma notu:
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import numpy as np
@@ -23,6 +24,11 @@ import streamlit as st
 
 import utils
 
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except Exception:  # Eski/farkli Streamlit surumlerinde bu modul olmayabilir.
+    get_script_run_ctx = None
+
 
 # ---------------------------------------------------------------------------
 # Dogrudan calistirma destegi
@@ -36,9 +42,9 @@ import utils
 def streamlit_icinde_mi() -> bool:
     """Kod Streamlit tarafindan mi calistiriliyor?"""
 
+    if get_script_run_ctx is None:
+        return False
     try:
-        from streamlit.runtime.scriptrunner import get_script_run_ctx
-
         return get_script_run_ctx() is not None
     except Exception:
         return False
@@ -103,16 +109,126 @@ def arac_etiketi(satir: pd.Series) -> str:
     return f"{marka} {model}".strip() if (marka or model) else f"Arac #{int(satir.name) + 1}"
 
 
-@st.cache_data(show_spinner=False)
+def arac_etiketleri(tablo: pd.DataFrame) -> pd.Series:
+    """
+    `arac_etiketi` fonksiyonunun tablo uzerinde toplu (satir satir dolasmadan) calisan surumu.
+    """
+
+    marka = tablo["marka"].astype("string").fillna("").str.strip()
+    model = tablo["model"].astype("string").fillna("").str.strip()
+    yil = tablo["yil"]
+
+    temel = (marka + " " + model).str.strip()
+    yilli = (temel + " (" + yil.fillna(0).astype("Int64").astype(str) + ")").str.strip()
+    yedek = pd.Series([f"Arac #{int(i) + 1}" for i in tablo.index], index=tablo.index)
+
+    etiketler = np.where(yil.notna(), yilli, np.where(temel != "", temel, yedek))
+    return pd.Series(etiketler, index=tablo.index, name="arac")
+
+
+@st.cache_resource(show_spinner=False)
 def verisetini_yukle() -> pd.DataFrame:
     """
     Streamlit her etkileisimde kodu bastan calistirdigi icin,
     veriyi onbellege almak uygulamayi hizlandirir.
+
+    Notlar:
+    - Ilk okumada utils, veriyi `dataset.parquet` olarak da saklar; `dataset.xlsx`
+      degismedigi surece sonraki acilislar bu dosyadan yapilir.
+    - `cache_resource` her calistirmada ayni DataFrame'i dondurur; bu nedenle
+      donen tablo yerinde degistirilmemelidir.
     """
 
     return utils.verisetini_yukle_ve_hazirla_xlsx(VERI_DOSYASI_YOLU)
 
 
+@st.cache_resource(show_spinner=False)
+def veri_onizlemesi(satir_sayisi: int = 20) -> pd.DataFrame:
+    """
+    Veri setinin ilk satirlarini dondurur.
+
+    Veri seti ile ayni sekilde bir kez hazirlanir; `st.cache_data` gibi tum tabloyu
+    her etkilesimde hash'lemek gerekmez.
+    """
+
+    return verisetini_yukle().head(satir_sayisi)
+
+
+@st.cache_data(show_spinner=False)
+def csv_verisi(tablo: pd.DataFrame) -> bytes:
+    """
+    Tabloyu indirme butonu icin CSV baytlarina cevirir.
+
+    Metin olusturup sonra `encode` etmek yerine dogrudan bellekteki bir tampona yazar;
+    sonuc onbellekte tutuldugu icin her etkilesimde yeniden uretilmez.
+    """
+
+    tampon = io.BytesIO()
+    tablo.to_csv(tampon, index=False, encoding="utf-8")
+    return tampon.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def ahp_hesapla(ikili_matris: np.ndarray, kriterler: tuple[str, ...]) -> utils.AHPHesapSonucu:
+    """
+    AHP sonucunu onbellege alir.
+
+    Streamlit her etkilesimde betigi bastan calistirir; girdiler degismediyse
+    ayni hesap tekrar yapilmaz.
+    """
+
+    return utils.ahp_agirliklarini_hesapla(ikili_matris, list(kriterler))
+
+
+def karar_matrisi_olustur(
+    araclar: pd.DataFrame,
+    kullanici_tercihleri: dict[str, object],
+    yakit_puanlari: dict[str, float],
+    kasa_puanlari: dict[str, float],
+) -> pd.DataFrame:
+    """
+    TOPSIS karar matrisini olusturur.
+
+    Onbellege alinmaz: tum arac tablosunu her cagrida hash'lemek, matrisi yeniden
+    olusturmaktan daha pahalidir.
+    """
+
+    return utils.kullanici_maliyet_matrisi_olustur(
+        araclar,
+        kullanici_yakit_tipi=kullanici_tercihleri["yakit_tipi"],
+        kullanici_beygir_gucu=kullanici_tercihleri["beygir_gucu"],
+        kullanici_kapi_sayisi=kullanici_tercihleri["kapi_sayisi"],
+        kullanici_kasa_tipi=kullanici_tercihleri["kasa_tipi"],
+        yakit_puanlari=yakit_puanlari,
+        kasa_puanlari=kasa_puanlari,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def topsis_puanlari(karar: pd.DataFrame, agirliklar: dict[str, float]) -> pd.Series:
+    """TOPSIS puanlarini hesaplar; sonuc girdilere gore onbellege alinir."""
+
+    return utils.topsis_puanlarini_hesapla(karar, agirliklar=agirliklar, yonler=TOPSIS_YONLERI)
+
+
+def tam_siralama(araclar: pd.DataFrame, puanlar: pd.Series) -> pd.DataFrame:
+    """
+    Tum araclari TOPSIS puanina gore siralar (ekrandaki ilk 10 ve CSV disari aktarimi icin).
+
+    Once tablonun kopyasini alip sonra siralamak yerine siralama permutasyonu bulunur
+    ve tablo tek seferde bu sirayla secilir. Bu islem tabloyu hash'lemekten ucuz oldugu
+    icin onbellege alinmaz.
+    """
+
+    puan_dizisi = puanlar.to_numpy()
+    sira = np.argsort(-puan_dizisi, kind="stable")
+    return (
+        araclar.iloc[sira]
+        .assign(topsis_puani=puan_dizisi[sira], sira=np.arange(1, len(sira) + 1))
+        .reset_index(drop=True)
+    )
+
+
 def puanlari_duzenle(baslik: str, puanlar: dict[str, float], *, anahtar: str) -> dict[str, float]:
     """
     Kenar cubukta kategori puanlarini basit bir tabloda duzenletebilmek icin kullanilir.
@@ -127,7 +243,7 @@ def puanlari_duzenle(baslik: str, puanlar: dict[str, float], *, anahtar: str) ->
         key=anahtar,
         column_config={"puan": st.column_config.NumberColumn(min_value=0.0, step=0.5, format="%.3f")},
     )
-    return {str(satir["kategori"]): float(satir["puan"]) for _, satir in duzenlenmis.iterrows()}
+    return dict(zip(duzenlenmis["kategori"].astype(str), duzenlenmis["puan"].astype(float)))
 
 
 # ---------------------------------------------------------------------------
@@ -149,7 +265,7 @@ with st.spinner("Veri seti yukleniyor..."):
         st.stop()
 
 st.write(f"Kayit sayisi: {len(araclar_df):,}")
-st.dataframe(araclar_df.head(20), use_container_width=True)
+st.dataframe(veri_onizlemesi(), use_container_width=True)
 
 
 # 2) Kategori puanlari (sidebar)
@@ -159,7 +275,7 @@ st.sidebar.caption("Kategorik degerleri sayisala cevirmek icin kullanilir.")
 yakit_puanlari = puanlari_duzenle("Yakit puanlari", VARSAYILAN_YAKIT_PUANLARI, anahtar="yakit_puanlari_duzenleyici")
 kasa_puanlari = puanlari_duzenle("Kasa puanlari", VARSAYILAN_KASA_PUANLARI, anahtar="kasa_puanlari_duzenleyici")
 
-if any(v < 0 for v in yakit_puanlari.values()) or any(v < 0 for v in kasa_puanlari.values()):
+if min(yakit_puanlari.values(), default=0) < 0 or min(kasa_puanlari.values(), default=0) < 0:
     st.sidebar.error("Puanlar 0 veya daha buyuk olmali.")
 
 
@@ -197,9 +313,7 @@ st.subheader("3) AHP ve TOPSIS (Otomatik)")
 st.write("Kriterlerin tamami es agirlikli olarak AHP hesaplanir; TOPSIS siralamasi otomatik yapilir.")
 
 try:
-    varsayilan_matris = np.ones((len(KRITERLER), len(KRITERLER)), dtype=float)
-    ahp_sonuc = utils.ahp_agirliklarini_hesapla(varsayilan_matris, KRITERLER)
-    st.session_state["ahp_sonuc"] = ahp_sonuc
+    ahp_sonuc = ahp_hesapla(utils.esit_onemli_ikili_matris(len(KRITERLER)), tuple(KRITERLER))
 
     sol, sag = st.columns([2, 1])
     with sol:
@@ -213,56 +327,35 @@ try:
         st.metric("CI", f"{ahp_sonuc.ci:.4f}")
         st.metric("CR", f"{ahp_sonuc.cr:.4f}")
 
-    karar = utils.kullanici_maliyet_matrisi_olustur(
-        araclar_df,
-        kullanici_yakit_tipi=kullanici_tercihleri["yakit_tipi"],
-        kullanici_beygir_gucu=kullanici_tercihleri["beygir_gucu"],
-        kullanici_kapi_sayisi=kullanici_tercihleri["kapi_sayisi"],
-        kullanici_kasa_tipi=kullanici_tercihleri["kasa_tipi"],
-        yakit_puanlari=yakit_puanlari,
-        kasa_puanlari=kasa_puanlari,
-    )
+    karar = karar_matrisi_olustur(araclar_df, kullanici_tercihleri, yakit_puanlari, kasa_puanlari)
+    puanlar = topsis_puanlari(karar, ahp_sonuc.agirliklar.to_dict())
 
-    puanlar = utils.topsis_puanlarini_hesapla(
-        karar,
-        agirliklar=ahp_sonuc.agirliklar.to_dict(),
-        yonler=TOPSIS_YONLERI,
-    )
-
-    sirali = araclar_df.copy()
-    sirali["topsis_puani"] = puanlar
-    sirali = sirali.sort_values("topsis_puani", ascending=False).reset_index(drop=True)
-    sirali["sira"] = np.arange(1, len(sirali) + 1)
-    st.session_state["sirali_df"] = sirali
+    sirali_df = tam_siralama(araclar_df, puanlar)
+    en_iyi_df = sirali_df.head(10)
     st.success("TOPSIS siralamasi tamamlandi.")
 except Exception as hata:
     st.error(f"Hesaplama hatasi: {hata}")
     st.stop()
 
-sirali_df: pd.DataFrame | None = st.session_state.get("sirali_df")
-if sirali_df is None:
-    st.error("Sirali sonuclar olusturulamadi.")
-    st.stop()
-
 
 # 6) Sonuclar + disari aktar
 st.subheader("5) Sonuclar")
 
-en_iyi3 = sirali_df.head(3).copy()
-en_iyi3["arac"] = en_iyi3.apply(arac_etiketi, axis=1)
+en_iyi3 = en_iyi_df.head(3).copy()
+en_iyi3["arac"] = arac_etiketleri(en_iyi3)
 st.dataframe(
     en_iyi3[["sira", "arac", "yakit_tipi", "beygir_gucu", "kapi_sayisi", "kasa_tipi", "topsis_puani"]],
     use_container_width=True,
 )
 
 st.write("**TOPSIS puanlari (ilk 10)**")
-en_iyi10 = sirali_df.head(10).copy()
-en_iyi10["arac"] = en_iyi10.apply(arac_etiketi, axis=1)
+en_iyi10 = en_iyi_df.copy()
+en_iyi10["arac"] = arac_etiketleri(en_iyi10)
 st.bar_chart(en_iyi10.set_index("arac")["topsis_puani"], use_container_width=True)
 
-en_iyi = sirali_df.iloc[0]
-alt1 = sirali_df.iloc[1] if len(sirali_df) > 1 else None
-alt2 = sirali_df.iloc[2] if len(sirali_df) > 2 else None
+en_iyi = en_iyi_df.iloc[0]
+alt1 = en_iyi_df.iloc[1] if len(en_iyi_df) > 1 else None
+alt2 = en_iyi_df.iloc[2] if len(en_iyi_df) > 2 else None
 
 
 def arac_satiri(satir: pd.Series) -> str:
@@ -282,7 +375,7 @@ st.write(f"Bu arac, en onemli kriterlerde iyi sonuc verdigi icin onerildi: {en_o
 st.subheader("6) Disari Aktar")
 st.download_button(
     "Siralama listesini CSV indir",
-    data=sirali_df.to_csv(index=False).encode("utf-8"),
+    data=csv_verisi(sirali_df),
     file_name="topsis_siralama.csv",
     mime="text/csv",
     use_container_width=True,
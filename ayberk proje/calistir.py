@@ -113,7 +113,7 @@ def modul_kontrolu(venv_python: Path, *, proje: Path) -> bool:
     - Gerekli moduller import edilebiliyor mu?
     """
 
-    kontrol_kodu = "import streamlit, pandas, numpy, openpyxl; print('tamam')"
+    kontrol_kodu = "import streamlit, pandas, numpy, openpyxl, pyarrow; print('tamam')"
     sonuc = subprocess.run([str(venv_python), "-c", kontrol_kodu], cwd=str(proje))
     return sonuc.returncode == 0
 
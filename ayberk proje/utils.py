@@ -9,9 +9,13 @@ Bu dosya, uygulamanin is mantigini icerir:
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, Mapping, Sequence
+from typing import Any, Callable, Literal, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
@@ -34,6 +38,10 @@ RASTGELE_INDEKS_TABLOSU: dict[int, float] = {
 }
 
 
+# Veri hazirlama ciktisi (sutunlar/tipler) degistiginde artirilir; eski parquet onbellegi kullanilmaz.
+VERI_ONBELLEK_SURUMU = 5
+
+
 @dataclass(frozen=True)
 class AHPHesapSonucu:
     """
@@ -56,7 +64,7 @@ class AHPHesapSonucu:
 # ---------------------------------------------------------------------------
 
 
-def verisetini_yukle_ve_hazirla_xlsx(dosya_yolu: Path) -> pd.DataFrame:
+def verisetini_yukle_ve_hazirla_xlsx(dosya_yolu: Path, *, onbellek: bool = True) -> pd.DataFrame:
     """
     `dataset.xlsx` dosyasini okur ve uygulamanin kullanacagi sutunlara donusturur.
 
@@ -66,12 +74,86 @@ def verisetini_yukle_ve_hazirla_xlsx(dosya_yolu: Path) -> pd.DataFrame:
     - beygir_gucu
     - kapi_sayisi
     - kasa_tipi: hb/sedan/suv/kupe
+
+    Onbellek:
+    - Excel okumak yavas oldugu icin hazirlanan tablo yanina `<ad>.parquet` olarak yazilir
+      (`<ad>.meta.json` dosyasinda kaynak dosyanin degisim zamani tutulur).
+    - Kaynak dosya degismedigi surece sonraki okumalar parquet dosyasindan yapilir.
+    - Ayrica ayni surecte tekrarlanan cagrilar dosyaya hic gitmeden bellekten doner.
+      Donen tablo onbellekteki tablonun sig kopyasidir; sutun eklemek/degistirmek
+      onbellegi etkilemez, ama hucreleri yerinde degistirmekten kacinilmalidir.
     """
 
     if not dosya_yolu.exists():
         raise FileNotFoundError(f"Veri dosyasi bulunamadi: {dosya_yolu}")
 
-    ham = pd.read_excel(dosya_yolu)
+    if not onbellek:
+        return _xlsx_oku_ve_hazirla(dosya_yolu)
+
+    veri = _onbellekli_yukle(dosya_yolu.resolve(), dosya_yolu.stat().st_mtime_ns)
+    return veri.copy(deep=False)
+
+
+@functools.lru_cache(maxsize=4)
+def _onbellekli_yukle(dosya_yolu: Path, kaynak_mtime_ns: int) -> pd.DataFrame:
+    """
+    Parquet onbellegini kullanarak veri setini yukler.
+
+    Degisim zamani anahtarin parcasi oldugu icin kaynak dosya degisince bellekteki
+    eski tablo kullanilmaz.
+    """
+
+    onbellek_yolu = dosya_yolu.with_suffix(".parquet")
+    bilgi_yolu = dosya_yolu.with_suffix(".meta.json")
+    bilgi = {"kaynak_mtime_ns": kaynak_mtime_ns, "surum": VERI_ONBELLEK_SURUMU}
+
+    if onbellek_yolu.exists() and _onbellek_bilgisi_oku(bilgi_yolu) == bilgi:
+        try:
+            return pd.read_parquet(onbellek_yolu)
+        except Exception:
+            # Bozuk/yarim onbellek kullaniciyi kilitlememeli: Excel'den yeniden uretilir.
+            pass
+
+    veri = _xlsx_oku_ve_hazirla(dosya_yolu)
+    try:
+        _atomik_yaz(onbellek_yolu, lambda yol: veri.to_parquet(yol, engine="pyarrow", compression="zstd"))
+        _atomik_yaz(bilgi_yolu, lambda yol: yol.write_text(json.dumps(bilgi) + "\n", encoding="utf-8"))
+    except Exception:
+        # Onbellek yazilamazsa (salt-okunur klasor, pyarrow yok vb.) veri yine de dondurulur.
+        pass
+    return veri
+
+
+def _atomik_yaz(hedef: Path, yaz: Callable[[Path], Any]) -> None:
+    """
+    Dosyayi ayni klasordeki gecici bir dosyaya yazip `os.replace` ile yerine tasir.
+
+    Yazma yarida kesilirse (surec oldurulur, disk dolar) hedefte yarim dosya kalmaz;
+    ayni anda yazan oturumlar da birbirinin gecici dosyasini ezmez.
+    """
+
+    tanimlayici, gecici = tempfile.mkstemp(dir=hedef.parent, prefix=hedef.name + ".", suffix=".tmp")
+    os.close(tanimlayici)
+    gecici_yol = Path(gecici)
+    try:
+        yaz(gecici_yol)
+        os.replace(gecici_yol, hedef)
+    except BaseException:
+        gecici_yol.unlink(missing_ok=True)
+        raise
+
+
+def _onbellek_bilgisi_oku(bilgi_yolu: Path) -> dict[str, Any] | None:
+    """Parquet onbelleginin bilgi dosyasini okur; yoksa veya bozuksa None doner."""
+
+    try:
+        return json.loads(bilgi_yolu.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _xlsx_oku_ve_hazirla(dosya_yolu: Path) -> pd.DataFrame:
+    """Excel dosyasini okuyup standart sutunlara donusturur (onbellek kullanmadan)."""
 
     gerekli_sutunlar = {
         "Make": "marka",
@@ -83,28 +165,95 @@ def verisetini_yukle_ve_hazirla_xlsx(dosya_yolu: Path) -> pd.DataFrame:
         "Vehicle Style": "kasa_ham",
     }
 
+    # Sadece gerekli sutunlar okunur; metin sutunlari dogrudan kategorik olarak gelir.
+    # (Sayisal sutunlar bozuk hucreler olabilecegi icin asagida guvenli sekilde cevrilir.)
+    ham = _excel_oku(
+        dosya_yolu,
+        usecols=lambda sutun: sutun in gerekli_sutunlar,
+        dtype={s: "category" for s in ("Make", "Model", "Engine Fuel Type", "Vehicle Style")},
+    )
+
     eksik = [s for s in gerekli_sutunlar.keys() if s not in ham.columns]
     if eksik:
         raise ValueError(f"Veri setinde gerekli sutunlar eksik: {', '.join(eksik)}")
 
     veri = ham[list(gerekli_sutunlar.keys())].rename(columns=gerekli_sutunlar).copy()
 
-    veri["yakit_tipi"] = veri["yakit_ham"].apply(_yakit_tipini_standartlastir)
-    veri["kasa_tipi"] = veri["kasa_ham"].apply(_kasa_tipini_standartlastir)
+    veri["yakit_tipi"] = _yakit_tiplerini_standartlastir(veri["yakit_ham"])
+    veri["kasa_tipi"] = _kasa_tiplerini_standartlastir(veri["kasa_ham"])
 
-    veri["beygir_gucu"] = veri["beygir_gucu"].apply(_float_cevir)
-    veri["kapi_sayisi"] = veri["kapi_sayisi"].apply(_int_cevir)
+    # Sayiya cevrilemeyen hucreler NaN olur ve asagida eleme ile atilir.
+    veri["beygir_gucu"] = pd.to_numeric(veri["beygir_gucu"], errors="coerce")
+    veri["kapi_sayisi"] = pd.to_numeric(veri["kapi_sayisi"], errors="coerce").round()
 
     sutunlar = ["marka", "model", "yil", "yakit_tipi", "beygir_gucu", "kapi_sayisi", "kasa_tipi"]
     veri = veri[sutunlar].dropna(subset=["yakit_tipi", "kasa_tipi", "beygir_gucu", "kapi_sayisi"])
 
-    veri["beygir_gucu"] = veri["beygir_gucu"].astype(float)
-    veri["kapi_sayisi"] = veri["kapi_sayisi"].astype(int)
-    veri["yil"] = veri["yil"].astype(int)
+    # Degerler kucuk araliklarda oldugu icin dar tipler yeterli (bellek ve bant genisligi yarilanir).
+    veri["beygir_gucu"] = veri["beygir_gucu"].astype(np.float32)
+    veri["kapi_sayisi"] = veri["kapi_sayisi"].astype(np.int8)
+    veri["yil"] = veri["yil"].astype(np.int16)
+
+    # Az sayida farkli degeri olan sutunlar kategorik tutulur: bellek azalir ve
+    # puanlama satir basina sozluk aramasi yerine kategori kodlari uzerinden yapilir.
+    for sutun in ("marka", "model", "yakit_tipi", "kasa_tipi"):
+        veri[sutun] = veri[sutun].astype("category")
 
     return veri.reset_index(drop=True)
 
 
+def _excel_oku(dosya_yolu: Path, **okuma_ayarlari: Any) -> pd.DataFrame:
+    """
+    Excel dosyasini okur (`okuma_ayarlari` dogrudan `pd.read_excel`'e aktarilir).
+
+    Rust tabanli `calamine` okuyucusu openpyxl'den belirgin sekilde hizlidir;
+    `python-calamine` kurulu degilse (veya pandas surumu desteklemiyorsa) openpyxl'e donulur.
+    """
+
+    try:
+        return pd.read_excel(dosya_yolu, engine="calamine", **okuma_ayarlari)
+    except ImportError:
+        return pd.read_excel(dosya_yolu, engine="openpyxl", **okuma_ayarlari)
+    except ValueError as hata:
+        if "calamine" not in str(hata):
+            raise
+        return pd.read_excel(dosya_yolu, engine="openpyxl", **okuma_ayarlari)
+
+
+def _yakit_tiplerini_standartlastir(sutun: pd.Series) -> np.ndarray:
+    """
+    `_yakit_tipini_standartlastir` fonksiyonunun tum sutun uzerinde toplu calisan surumu.
+
+    Kurallar ve oncelik sirasi aynidir; eslesmeyen/bos degerler None olur.
+    """
+
+    metin = sutun.astype("string").str.lower()
+    kosullar = [
+        metin.str.contains("electric", regex=False, na=False),
+        metin.str.contains("hybrid", regex=False, na=False),
+        metin.str.contains("diesel", regex=False, na=False),
+        metin.str.contains("unleaded|gasoline|flex-fuel|e85|ethanol|gas", regex=True, na=False),
+    ]
+    return np.select(kosullar, ["elektrik", "hibrit", "dizel", "benzin"], default=None)
+
+
+def _kasa_tiplerini_standartlastir(sutun: pd.Series) -> np.ndarray:
+    """
+    `_kasa_tipini_standartlastir` fonksiyonunun tum sutun uzerinde toplu calisan surumu.
+
+    Kurallar ve oncelik sirasi aynidir; eslesmeyen/bos degerler None olur.
+    """
+
+    metin = sutun.astype("string").str.lower()
+    kosullar = [
+        metin.str.contains("suv|crossover", regex=True, na=False),
+        metin.str.contains("hatch", regex=False, na=False),
+        metin.str.contains("sedan", regex=False, na=False),
+        metin.str.contains("coupe", regex=False, na=False),
+    ]
+    return np.select(kosullar, ["suv", "hb", "sedan", "kupe"], default=None)
+
+
 def _yakit_tipini_standartlastir(deger: Any) -> str | None:
     """
     Yakit bilgisini 4 ana sinifa indirger:
@@ -153,32 +302,23 @@ def _kasa_tipini_standartlastir(deger: Any) -> str | None:
     return None
 
 
-def _float_cevir(deger: Any) -> float | None:
-    """Gelen degeri guvenli sekilde float'a cevirir; olmazsa None doner."""
-
-    if deger is None or (isinstance(deger, float) and np.isnan(deger)):
-        return None
-    try:
-        return float(deger)
-    except Exception:
-        return None
-
+# ---------------------------------------------------------------------------
+# AHP
+# ---------------------------------------------------------------------------
 
-def _int_cevir(deger: Any) -> int | None:
-    """Gelen degeri guvenli sekilde int'e cevirir; olmazsa None doner."""
 
-    sayi = _float_cevir(deger)
-    if sayi is None:
-        return None
-    try:
-        return int(round(sayi))
-    except Exception:
-        return None
+@functools.lru_cache(maxsize=8)
+def esit_onemli_ikili_matris(n: int) -> np.ndarray:
+    """
+    Tum kriterlerin es onemde oldugu n x n ikili karsilastirma matrisini (birler) dondurur.
 
+    Modul surec boyunca yuklu kaldigi icin matris bir kez uretilir; ayni nesne paylasildigindan
+    salt-okunur yapilir.
+    """
 
-# ---------------------------------------------------------------------------
-# AHP
-# ---------------------------------------------------------------------------
+    matris = np.ones((n, n), dtype=np.float64)
+    matris.setflags(write=False)
+    return matris
 
 
 def ikili_karsilastirma_matrisi_dogrula(matris: np.ndarray, *, tolerans: float = 1e-8) -> list[str]:
@@ -197,14 +337,16 @@ def ikili_karsilastirma_matrisi_dogrula(matris: np.ndarray, *, tolerans: float =
     if matris.ndim != 2 or matris.shape[0] != matris.shape[1]:
         return ["Ikili karsilastirma matrisi kare olmali (n x n)."]
 
-    if not np.isfinite(matris).all() or np.any(matris <= 0):
+    if not np.all((matris > 0) & np.isfinite(matris)):
         hatalar.append("Tum hucreler pozitif ve sonlu sayilar olmali.")
 
     if not np.allclose(np.diag(matris), 1.0, atol=tolerans):
         hatalar.append("Kosegen degerleri 1 olmali.")
 
-    karsilik = np.reciprocal(matris, where=matris != 0)
-    if not np.allclose(matris.T, karsilik, atol=1e-6):
+    # a_ij = 1 / a_ji  <=>  a_ij * a_ji = 1 (bolme ve sifira bolme kontrolu gerekmez).
+    with np.errstate(invalid="ignore", over="ignore"):
+        karsilikli = np.allclose(matris * matris.T, 1.0, atol=1e-6)
+    if not karsilikli:
         hatalar.append("Matris karsilikli olmali: a_ij = 1 / a_ji.")
 
     return hatalar
@@ -215,9 +357,9 @@ def ahp_agirliklarini_hesapla(ikili_matris: np.ndarray, kriterler: Sequence[str]
     AHP agirliklarini en buyuk ozvektor yontemi ile hesaplar.
 
     Ozet:
-    1) Ozdeger/ozvektorleri bul
-    2) En buyuk ozdegerin ozvektorunu al
-    3) Ozvektoru normalize et (toplam 1) -> agirliklar
+    1) Ana ozvektoru matrisin kuvvetleri ile bul (bkz. `_ahp_ozvektoru`)
+    2) Ozvektoru normalize et (toplam 1) -> agirliklar
+    3) En buyuk ozdegeri (lambda maks) hesapla
     4) CI ve CR hesapla
     """
 
@@ -229,12 +371,7 @@ def ahp_agirliklarini_hesapla(ikili_matris: np.ndarray, kriterler: Sequence[str]
     if hatalar:
         raise ValueError("Gecersiz ikili karsilastirma matrisi: " + "; ".join(hatalar))
 
-    ozdegerler, ozvektorler = np.linalg.eig(matris)
-    indeks = int(np.argmax(ozdegerler.real))
-
-    lambda_maks = float(ozdegerler.real[indeks])
-    ana_ozvektor = np.abs(ozvektorler[:, indeks].real)
-    agirliklar = ana_ozvektor / ana_ozvektor.sum()
+    agirliklar, lambda_maks = _ahp_ozvektoru(matris)
 
     n = matris.shape[0]
     ci = float((lambda_maks - n) / (n - 1)) if n > 1 else 0.0
@@ -253,6 +390,32 @@ def ahp_agirliklarini_hesapla(ikili_matris: np.ndarray, kriterler: Sequence[str]
     )
 
 
+def _ahp_ozvektoru(matris: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Pozitif karsilikli matrisin ana ozvektorunu (toplami 1) ve en buyuk ozdegerini bulur.
+
+    Matrisin karesi tekrar tekrar alinir (A, A^2, A^4, ...); satir toplamlari hizla ana
+    ozvektore yakinsar. Ozvektor gercel ve pozitif ciktigi icin `np.linalg.eig` sonrasindaki
+    abs/real temizligine gerek kalmaz.
+    """
+
+    kuvvet = matris / matris.sum()
+    agirlik = kuvvet.sum(axis=1)
+
+    for _ in range(30):
+        kuvvet = kuvvet @ kuvvet
+        kuvvet /= kuvvet.sum()
+
+        yeni = kuvvet.sum(axis=1)
+        fark = np.abs(yeni - agirlik).max()
+        agirlik = yeni
+        if fark < 1e-12:
+            break
+
+    # A w = lambda w oldugundan: lambda = toplam(A w) / toplam(w)
+    return agirlik, float((matris @ agirlik).sum() / agirlik.sum())
+
+
 # ---------------------------------------------------------------------------
 # TOPSIS
 # ---------------------------------------------------------------------------
@@ -283,12 +446,35 @@ def kullanici_maliyet_matrisi_olustur(
     yakit_hedef = float(yakit_puanlari[kullanici_yakit_tipi])
     kasa_hedef = float(kasa_puanlari[kullanici_kasa_tipi])
 
-    karar = pd.DataFrame(index=araclar.index)
-    karar["yakit_tipi"] = araclar["yakit_tipi"].map(yakit_puanlari).astype(float).sub(yakit_hedef).abs()
-    karar["beygir_gucu"] = (araclar["beygir_gucu"].astype(float) - float(kullanici_beygir_gucu)).abs()
-    karar["kapi_sayisi"] = (araclar["kapi_sayisi"].astype(int) - int(kullanici_kapi_sayisi)).abs().astype(float)
-    karar["kasa_tipi"] = araclar["kasa_tipi"].map(kasa_puanlari).astype(float).sub(kasa_hedef).abs()
-    return karar
+    # Matris sutun sutun DataFrame uzerinde degil, tek bir NumPy dizisinde olusturulur.
+    karar = np.empty((len(araclar), 4), dtype=np.float32)
+    karar[:, 0] = np.abs(_kategori_puanlari(araclar["yakit_tipi"], yakit_puanlari) - yakit_hedef)
+    karar[:, 1] = np.abs(araclar["beygir_gucu"].to_numpy(dtype=np.float32) - np.float32(kullanici_beygir_gucu))
+    karar[:, 2] = np.abs(araclar["kapi_sayisi"].to_numpy(dtype=np.float32) - np.float32(int(kullanici_kapi_sayisi)))
+    karar[:, 3] = np.abs(_kategori_puanlari(araclar["kasa_tipi"], kasa_puanlari) - kasa_hedef)
+
+    return pd.DataFrame(
+        karar,
+        index=araclar.index,
+        columns=["yakit_tipi", "beygir_gucu", "kapi_sayisi", "kasa_tipi"],
+        copy=False,
+    )
+
+
+def _kategori_puanlari(sutun: pd.Series, puanlar: Mapping[str, float]) -> np.ndarray:
+    """
+    Kategori degerlerini (karar matrisi ile ayni tipte, float32) puanlara cevirir;
+    puani olmayan degerler NaN olur.
+
+    Sutun kategorik ise her kategori icin bir kez puan bulunur ve satirlara kodlar
+    uzerinden tek bir `np.take` ile dagitilir. Son eleman NaN oldugu icin eksik deger
+    kodu (-1) NaN'a duser.
+    """
+
+    if isinstance(sutun.dtype, pd.CategoricalDtype):
+        tablo = np.array([puanlar.get(k, np.nan) for k in sutun.cat.categories] + [np.nan], dtype=np.float32)
+        return np.take(tablo, sutun.cat.codes.to_numpy())
+    return sutun.map(puanlar).to_numpy(dtype=np.float32, na_value=np.nan)
 
 
 def topsis_puanlarini_hesapla(
@@ -311,13 +497,21 @@ def topsis_puanlarini_hesapla(
     if karar_matrisi.empty:
         raise ValueError("Karar matrisi bos olamaz.")
 
-    matris = karar_matrisi.astype(float).to_numpy(copy=True)
+    # Matris zaten float32 ve bitisik ise kopya alinmaz (salt-okunur gorunum); asagida degistirilmez.
+    matris = np.ascontiguousarray(karar_matrisi.to_numpy(dtype=np.float32, copy=False))
     if not np.isfinite(matris).all():
         raise ValueError("Karar matrisinde gecersiz (sonlu olmayan) deger var.")
 
     sutunlar = list(karar_matrisi.columns)
 
-    w = np.array([float(agirliklar[s]) for s in sutunlar], dtype=float)
+    eksik_agirlik = set(sutunlar) - set(agirliklar)
+    if eksik_agirlik:
+        raise ValueError(f"Agirligi tanimlanmamis sutunlar: {', '.join(sorted(eksik_agirlik))}")
+    eksik_yon = set(sutunlar) - set(yonler)
+    if eksik_yon:
+        raise ValueError(f"Yonu tanimlanmamis sutunlar: {', '.join(sorted(eksik_yon))}")
+
+    w = np.fromiter((agirliklar[s] for s in sutunlar), dtype=float, count=len(sutunlar))
     if np.any(w < 0) or not np.isfinite(w).all():
         raise ValueError("Agirliklar pozitif ve sonlu olmalidir.")
 
@@ -327,34 +521,39 @@ def topsis_puanlarini_hesapla(
     w = w / w_toplam
 
     yon_listesi = [yonler[s] for s in sutunlar]
-    if any(y not in ("fayda", "maliyet") for y in yon_listesi):
-        raise ValueError("Yonler 'fayda' veya 'maliyet' olmalidir.")
+    gecersiz_yon = set(yon_listesi) - {"fayda", "maliyet"}
+    if gecersiz_yon:
+        gecersizler = ", ".join(sorted(map(str, gecersiz_yon)))
+        raise ValueError(f"Yonler 'fayda' veya 'maliyet' olmalidir (gecersiz: {gecersizler}).")
+
+    fayda = np.fromiter((y == "fayda" for y in yon_listesi), dtype=np.bool_, count=len(yon_listesi))
+    puan = _topsis_puani(matris, w, fayda)
+
+    return pd.Series(puan, index=karar_matrisi.index, name="topsis_puani")
 
-    # 1) Normalize
-    payda = np.sqrt(np.sum(matris**2, axis=0))
+
+def _topsis_puani(matris: np.ndarray, w: np.ndarray, fayda: np.ndarray) -> np.ndarray:
+    """TOPSIS adimlarini NumPy ile uygular ve her satirin puanini dondurur."""
+
+    # 1-2) Normalize + agirlik uygula
+    # Sutun normu ve agirlik tek bir olcek vektorunde birlestirilir; boylece
+    # ara (n x m) normalize matrisi olusturulmadan tek geciste hesaplanir.
+    payda = np.sqrt(np.einsum("nm,nm->m", matris, matris, optimize=True))
     payda = np.where(payda == 0, 1.0, payda)
-    normalize = matris / payda
-
-    # 2) Agirlik uygula
-    agirlikli = normalize * w
-
-    # 3) Ideal / anti-ideal
-    ideal = np.empty(agirlikli.shape[1], dtype=float)
-    anti = np.empty(agirlikli.shape[1], dtype=float)
-    for j, yon in enumerate(yon_listesi):
-        if yon == "fayda":
-            ideal[j] = float(np.max(agirlikli[:, j]))
-            anti[j] = float(np.min(agirlikli[:, j]))
-        else:  # maliyet
-            ideal[j] = float(np.min(agirlikli[:, j]))
-            anti[j] = float(np.max(agirlikli[:, j]))
+    agirlikli = np.einsum("nm,m->nm", matris, w / payda, optimize=True)
+
+    # 3) Ideal / anti-ideal (fayda: en buyuk ideal, maliyet: en kucuk ideal)
+    sutun_max = agirlikli.max(axis=0)
+    sutun_min = agirlikli.min(axis=0)
+    ideal = np.where(fayda, sutun_max, sutun_min)
+    anti = np.where(fayda, sutun_min, sutun_max)
 
     # 4) Uzakliklar
-    d_arti = np.sqrt(np.sum((agirlikli - ideal) ** 2, axis=1))
-    d_eksi = np.sqrt(np.sum((agirlikli - anti) ** 2, axis=1))
+    fark = agirlikli - ideal
+    d_arti = np.sqrt(np.einsum("nm,nm->n", fark, fark, optimize=True))
+    fark = agirlikli - anti
+    d_eksi = np.sqrt(np.einsum("nm,nm->n", fark, fark, optimize=True))
 
     # 5) Puan
     payda = d_arti + d_eksi
-    puan = np.where(payda == 0, 0.0, d_eksi / payda)
-
-    return pd.Series(puan, index=karar_matrisi.index, name="topsis_puani")
+    return np.where(payda == 0, 0.0, d_eksi / payda)